@@ -6,19 +6,52 @@ Monitors Plex libraries and maintains detailed CSV records with IMDB links.
 
 import os
 import csv
-import json
+import shutil
 import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
+from xml.etree import ElementTree
 
 try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from plexapi.server import PlexServer
     from plexapi.video import Movie, Show, Episode
-except ImportError:
-    print("Error: plexapi not installed. Run: pip install plexapi")
+except ImportError as e:
+    print(f"Error: {e.name} not installed. Run: pip install -r requirements.txt")
     exit(1)
 
+# Prefer orjson when available; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Dated CSVs are compressed when zstandard is available
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +63,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default number of shows extracted concurrently
+MAX_WORKERS = 16
+
+# Libraries scanned concurrently
+MAX_LIBRARY_WORKERS = 4
+
+# Keep-alive connections held open to the Plex server
+HTTP_POOL_SIZE = 32
+
+# Items fetched per request when listing a library
+LISTING_PAGE_SIZE = 500
+
+# Plex metadata type IDs used when listing a library
+_PLEX_TYPE_MOVIE = 1
+_PLEX_TYPE_EPISODE = 4
+
+# Write buffer for CSV output files
+CSV_BUFFER_SIZE = 1 << 20
+
+# Bytes per GiB, for file_size_gb
+_GiB = 1 << 30
+
+# Compression level for dated CSVs
+ZSTD_LEVEL = 3
+
+# Rows handed to the CSV writer thread at a time
+WRITE_BATCH_SIZE = 500
+
+# Row batches buffered between extraction and the CSV writer thread
+WRITE_QUEUE_SIZE = 16
+
+# GUID prefix used by Plex for IMDB IDs
+_IMDB_PREFIX = 'imdb://'
+_IMDB_LEN = len(_IMDB_PREFIX)
+_NO_IMDB = {'imdb_id': None, 'imdb_url': None}
+
+# CSV columns, in the order rows are built
+FIELDNAMES = (
+    'type', 'title', 'show_title', 'season', 'episode', 'year',
+    'rating', 'content_rating', 'duration_minutes', 'studio',
+    'summary', 'genres', 'directors', 'actors', 'added_at',
+    'last_viewed_at', 'view_count', 'file_path', 'file_size_gb',
+    'video_resolution', 'imdb_id', 'imdb_url', 'plex_key'
+)
+
+
+def _fmt_dt(d: Optional[datetime]) -> Optional[str]:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without going through strftime."""
+    if d is None:
+        return None
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
+
+def _fmt_ts(ts: Optional[str]) -> Optional[str]:
+    """Format a Plex unix timestamp attribute the same way as _fmt_dt."""
+    if not ts:
+        return None
+    return _fmt_dt(datetime.fromtimestamp(int(ts)))
+
+
+def _map_ordered(executor: ThreadPoolExecutor, fn, items: Iterable, window: int) -> Iterator:
+    """Like executor.map, but submits lazily with at most `window` calls in flight."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _drop_page_cache(path: Path):
+    """Hint the kernel that a file's cached pages will not be read again soon."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            # DONTNEED skips dirty pages, so write the fresh file back first
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not drop page cache for {path}: {e}")
+
 
 class PlexMonitor:
     """Monitor Plex libraries and export detailed records."""
@@ -37,6 +156,8 @@ class PlexMonitor:
     def __init__(self, config_path: str = 'config.json'):
         """Initialize Plex monitor with configuration."""
         self.config = self._load_config(config_path)
+        self.max_workers = max(1, int(self.config.get('max_workers', MAX_WORKERS)))
+        self._session = self._build_session()
         self.plex = self._connect_plex()
         self.output_dir = Path(self.config.get('output_dir', './data'))
         self.output_dir.mkdir(exist_ok=True)
@@ -45,7 +166,7 @@ class PlexMonitor:
         """Load configuration from JSON file."""
         try:
             with open(config_path, 'r') as f:
-                return json.load(f)
+                return _json_loads(f.read())
         except FileNotFoundError:
             logger.error(f"Config file not found: {config_path}")
             logger.info("Creating default config file...")
@@ -54,13 +175,27 @@ class PlexMonitor:
                 "plex_token": "YOUR_PLEX_TOKEN_HERE",
                 "libraries": ["Movies", "TV Shows"],
                 "output_dir": "./data",
-                "csv_filename": "plex_library_{library}_{date}.csv"
+                "csv_filename": "plex_library_{library}_{date}.csv",
+                "max_workers": MAX_WORKERS
             }
             with open(config_path, 'w') as f:
-                json.dump(default_config, f, indent=2)
+                f.write(_json_dumps(default_config))
             logger.info(f"Created {config_path}. Please update with your Plex details.")
             exit(1)
 
+    def _build_session(self) -> requests.Session:
+        """Create a pooled HTTP session shared by all Plex requests."""
+        pool_size = max(HTTP_POOL_SIZE, self.max_workers * MAX_LIBRARY_WORKERS)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _connect_plex(self) -> PlexServer:
         """Connect to Plex server."""
         try:
@@ -73,96 +208,237 @@ class PlexMonitor:
                 exit(1)
 
             logger.info(f"Connecting to Plex server at {plex_url}")
-            return PlexServer(plex_url, plex_token)
+            return PlexServer(plex_url, plex_token, session=self._session)
         except Exception as e:
             logger.error(f"Failed to connect to Plex: {e}")
             exit(1)
 
-    def _get_imdb_info(self, item) -> Dict[str, Optional[str]]:
-        """Extract IMDB information from Plex item."""
-        imdb_id = None
-        imdb_url = None
-
-        # Try to get IMDB ID from GUIDs
-        for guid in getattr(item, 'guids', []):
-            if 'imdb://' in guid.id:
-                imdb_id = guid.id.split('imdb://')[1]
-                imdb_url = f"https://www.imdb.com/title/{imdb_id}/"
-                break
-
-        return {
-            'imdb_id': imdb_id,
-            'imdb_url': imdb_url
-        }
-
-    def _get_movie_data(self, movie: Movie) -> Dict:
-        """Extract data from a movie item."""
-        imdb_info = self._get_imdb_info(movie)
-
-        return {
-            'type': 'Movie',
-            'title': movie.title,
-            'year': movie.year,
-            'rating': movie.rating,
-            'content_rating': movie.contentRating,
-            'duration_minutes': round(movie.duration / 60000) if movie.duration else None,
-            'studio': movie.studio,
-            'summary': movie.summary,
-            'genres': ', '.join([g.tag for g in movie.genres]) if movie.genres else '',
-            'directors': ', '.join([d.tag for d in movie.directors]) if movie.directors else '',
-            'actors': ', '.join([a.tag for a in movie.roles[:5]]) if movie.roles else '',
-            'added_at': movie.addedAt.strftime('%Y-%m-%d %H:%M:%S') if movie.addedAt else None,
-            'last_viewed_at': movie.lastViewedAt.strftime('%Y-%m-%d %H:%M:%S') if movie.lastViewedAt else None,
-            'view_count': movie.viewCount,
-            'file_path': movie.locations[0] if movie.locations else '',
-            'file_size_gb': round(sum([part.size for part in movie.media[0].parts]) / (1024**3), 2) if movie.media and movie.media[0].parts else None,
-            'video_resolution': movie.media[0].videoResolution if movie.media else '',
-            'imdb_id': imdb_info['imdb_id'],
-            'imdb_url': imdb_info['imdb_url'],
-            'plex_key': movie.key,
-            'season': '',
-            'episode': '',
-            'show_title': ''
-        }
-
-    def _get_show_data(self, show: Show) -> List[Dict]:
-        """Extract data from a TV show and all its episodes."""
-        episodes_data = []
+    def _imdb_info_from_ids(self, guid_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Build IMDB information from the first IMDB GUID in guid_ids."""
+        for gid in guid_ids:
+            if gid and gid.startswith(_IMDB_PREFIX):
+                imdb_id = gid[_IMDB_LEN:]
+                return {
+                    'imdb_id': imdb_id,
+                    'imdb_url': f"https://www.imdb.com/title/{imdb_id}/"
+                }
 
+        return _NO_IMDB
+
+    def _plex_headers(self) -> Dict[str, str]:
+        """Headers for direct Plex requests."""
+        # Send the token as a header so it never appears in logged error URLs
+        return {'X-Plex-Token': self.config['plex_token']}
+
+    def _iter_video_elements(self, library, plex_type: int) -> Iterator[ElementTree.Element]:
+        """Stream every item of a Plex type in a library as a Video XML element, one page at a time."""
+        url = self.plex.url(f"/library/sections/{library.key}/all?type={plex_type}&includeGuids=1")
+        start = 0
+        while True:
+            headers = {
+                **self._plex_headers(),
+                'X-Plex-Container-Start': str(start),
+                'X-Plex-Container-Size': str(LISTING_PAGE_SIZE)
+            }
+            count = 0
+            with self._session.get(url, headers=headers, stream=True, timeout=self.plex._timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                context = ElementTree.iterparse(response.raw, events=('start', 'end'))
+                _, root = next(context)
+                for event, elem in context:
+                    if event == 'end' and elem.tag == 'Video':
+                        count += 1
+                        yield elem
+                        # Drop finished items so memory stays flat
+                        root.clear()
+
+            if count < LISTING_PAGE_SIZE:
+                return
+            start += count
+
+    def _get_movie_tags(self, elem: ElementTree.Element) -> Tuple[str, str, str]:
+        """Return a movie's genres, directors and top actors as CSV strings."""
+        # Library listings cut tag lists short, so read them from the movie's
+        # own metadata; the listing tags are the fallback if that fetch fails
         try:
-            for episode in show.episodes():
-                imdb_info = self._get_imdb_info(episode)
-
-                episode_data = {
-                    'type': 'Episode',
-                    'title': episode.title,
-                    'show_title': show.title,
-                    'season': episode.seasonNumber,
-                    'episode': episode.episodeNumber,
-                    'year': episode.year,
-                    'rating': episode.rating,
-                    'content_rating': episode.contentRating,
-                    'duration_minutes': round(episode.duration / 60000) if episode.duration else None,
-                    'studio': show.studio,
-                    'summary': episode.summary,
-                    'genres': ', '.join([g.tag for g in show.genres]) if show.genres else '',
-                    'directors': ', '.join([d.tag for d in episode.directors]) if episode.directors else '',
-                    'actors': ', '.join([a.tag for a in show.roles[:5]]) if show.roles else '',
-                    'added_at': episode.addedAt.strftime('%Y-%m-%d %H:%M:%S') if episode.addedAt else None,
-                    'last_viewed_at': episode.lastViewedAt.strftime('%Y-%m-%d %H:%M:%S') if episode.lastViewedAt else None,
-                    'view_count': episode.viewCount,
-                    'file_path': episode.locations[0] if episode.locations else '',
-                    'file_size_gb': round(sum([part.size for part in episode.media[0].parts]) / (1024**3), 2) if episode.media and episode.media[0].parts else None,
-                    'video_resolution': episode.media[0].videoResolution if episode.media else '',
-                    'imdb_id': imdb_info['imdb_id'],
-                    'imdb_url': imdb_info['imdb_url'],
-                    'plex_key': episode.key
-                }
-                episodes_data.append(episode_data)
+            url = self.plex.url(f"/library/metadata/{elem.get('ratingKey')}")
+            response = self._session.get(url, headers=self._plex_headers(), timeout=self.plex._timeout)
+            response.raise_for_status()
+            video = ElementTree.fromstring(response.content).find('Video')
+            if video is not None:
+                elem = video
+        except Exception as e:
+            logger.error(f"Error loading tags for movie {elem.get('title')}: {e}")
+
+        roles = elem.findall('Role')
+        return (
+            ', '.join(g.get('tag') for g in elem.iterfind('Genre')),
+            ', '.join(d.get('tag') for d in elem.iterfind('Director')),
+            ', '.join(a.get('tag') for a in roles[:5])
+        )
+
+    def _get_movie_data(self, elem: ElementTree.Element) -> Tuple:
+        """Extract a CSV row from a movie's Video XML element."""
+        genres_str, directors_str, actors_str = self._get_movie_tags(elem)
+        imdb_info = self._imdb_info_from_ids(guid.get('id') for guid in elem.iterfind('Guid'))
+        media0 = elem.find('Media')
+        parts = media0.findall('Part') if media0 is not None else None
+        duration = int(elem.get('duration') or 0)
+
+        return (
+            'Movie',
+            elem.get('title'),
+            '',
+            '',
+            '',
+            elem.get('year'),
+            elem.get('rating'),
+            elem.get('contentRating'),
+            round(duration / 60000) if duration else None,
+            elem.get('studio'),
+            elem.get('summary'),
+            genres_str,
+            directors_str,
+            actors_str,
+            _fmt_ts(elem.get('addedAt')),
+            _fmt_ts(elem.get('lastViewedAt')),
+            elem.get('viewCount', '0'),
+            parts[0].get('file', '') if parts else '',
+            round(sum(int(part.get('size') or 0) for part in parts) / _GiB, 2) if parts else None,
+            media0.get('videoResolution') if media0 is not None else '',
+            imdb_info['imdb_id'],
+            imdb_info['imdb_url'],
+            elem.get('key')
+        )
+
+    def _get_show_info(self, show: Show) -> Tuple[str, Optional[str], str, str]:
+        """Extract the show-level fields shared by every episode of a show."""
+        try:
+            show_genres = show.genres
+            show_roles = show.roles
+            return (
+                show.title,
+                show.studio,
+                ', '.join(g.tag for g in show_genres) if show_genres else '',
+                ', '.join(a.tag for a in show_roles[:5]) if show_roles else ''
+            )
         except Exception as e:
             logger.error(f"Error processing show {show.title}: {e}")
+            return (show.title, None, '', '')
+
+    def _get_episode_data(self, elem: ElementTree.Element, show_info: Tuple) -> Tuple:
+        """Extract a CSV row from an episode's Video XML element."""
+        show_title, show_studio, show_genres_str, show_actors_str = show_info
+        imdb_info = self._imdb_info_from_ids(guid.get('id') for guid in elem.iterfind('Guid'))
+        media0 = elem.find('Media')
+        parts = media0.findall('Part') if media0 is not None else None
+        duration = int(elem.get('duration') or 0)
+
+        return (
+            'Episode',
+            elem.get('title'),
+            show_title,
+            elem.get('parentIndex'),
+            elem.get('index'),
+            elem.get('year'),
+            elem.get('rating'),
+            elem.get('contentRating'),
+            round(duration / 60000) if duration else None,
+            show_studio,
+            elem.get('summary'),
+            show_genres_str,
+            ', '.join(d.get('tag') for d in elem.iterfind('Director')),
+            show_actors_str,
+            _fmt_ts(elem.get('addedAt')),
+            _fmt_ts(elem.get('lastViewedAt')),
+            elem.get('viewCount', '0'),
+            parts[0].get('file', '') if parts else '',
+            round(sum(int(part.get('size') or 0) for part in parts) / _GiB, 2) if parts else None,
+            media0.get('videoResolution') if media0 is not None else '',
+            imdb_info['imdb_id'],
+            imdb_info['imdb_url'],
+            elem.get('key')
+        )
+
+    def _iter_movie_rows(self, library) -> Iterator[Tuple]:
+        """Yield a CSV row for every movie in a movie library."""
+        # Each movie needs its own tag fetch; run them on the pool, in library order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from _map_ordered(
+                executor,
+                self._get_movie_data,
+                self._iter_video_elements(library, _PLEX_TYPE_MOVIE),
+                self.max_workers * 2
+            )
 
-        return episodes_data
+    def _iter_show_rows(self, library) -> Iterator[Tuple]:
+        """Yield a CSV row for every episode in a TV library."""
+        shows = library.all()
+        if not shows:
+            return
+
+        # Show-level fields may each need a metadata reload; load many shows at once
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            show_infos = dict(zip(
+                (str(show.ratingKey) for show in shows),
+                _map_ordered(executor, self._get_show_info, shows, self.max_workers * 2)
+            ))
+
+        # Read every episode from the streamed XML listing instead of plexapi objects
+        for elem in self._iter_video_elements(library, _PLEX_TYPE_EPISODE):
+            show_info = show_infos.get(elem.get('grandparentRatingKey'))
+            if show_info is None:
+                show_info = (elem.get('grandparentTitle'), None, '', '')
+            yield self._get_episode_data(elem, show_info)
+
+    def _iter_rows(self, library) -> Iterator[Tuple]:
+        """Yield a CSV row for every movie and episode in a library."""
+        # Dispatch on the section type; other library types have no rows
+        handlers = {'movie': self._iter_movie_rows, 'show': self._iter_show_rows}
+        handler = handlers.get(library.type)
+        if handler is not None:
+            yield from handler(library)
+
+    def _write_rows(self, batches: queue.Queue, csv_path: Path, errors: List[Exception]):
+        """Write row batches from the queue to a CSV file until a None sentinel arrives."""
+        finished = False
+        try:
+            with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
+                for batch in iter(batches.get, None):
+                    writer.writerows(batch)
+                finished = True
+        except Exception as e:
+            errors.append(e)
+            # Keep draining so producers blocked on a full queue can finish,
+            # unless the sentinel was already consumed (e.g. the final flush failed)
+            if not finished:
+                for _ in iter(batches.get, None):
+                    pass
+
+    def _archive_csv(self, src: Path, csv_path: Path) -> Path:
+        """Store the dated copy of a CSV, zstd-compressed when zstandard is installed."""
+        archive_path = csv_path if zstd is None else csv_path.with_name(csv_path.name + '.zst')
+        tmp_path = archive_path.with_name(archive_path.name + '.tmp')
+
+        # Build the snapshot under a temporary name so a failure never leaves a partial file
+        try:
+            if zstd is None:
+                shutil.copyfile(src, tmp_path)
+            else:
+                cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+                with open(src, 'rb') as fin, open(tmp_path, 'wb') as fout:
+                    cctx.copy_stream(fin, fout)
+            os.replace(tmp_path, archive_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        # The snapshot is rarely read before the next run; keep it out of the page cache
+        _drop_page_cache(archive_path)
+        return archive_path
 
     def monitor_library(self, library_name: str) -> str:
         """Monitor a specific library and export to CSV."""
@@ -170,15 +446,6 @@ class PlexMonitor:
             logger.info(f"Monitoring library: {library_name}")
             library = self.plex.library.section(library_name)
 
-            all_data = []
-
-            # Process all items in the library
-            for item in library.all():
-                if isinstance(item, Movie):
-                    all_data.append(self._get_movie_data(item))
-                elif isinstance(item, Show):
-                    all_data.extend(self._get_show_data(item))
-
             # Generate CSV filename
             date_str = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename_template = self.config.get('csv_filename', 'plex_library_{library}_{date}.csv')
@@ -187,36 +454,52 @@ class PlexMonitor:
                 date=date_str
             )
             csv_path = self.output_dir / filename
+            latest_path = self.output_dir / f"plex_library_{library_name.replace(' ', '_')}_latest.csv"
+            tmp_path = latest_path.with_name(latest_path.name + '.tmp')
+
+            # A single writer thread drains rows while they are being produced
+            batches = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            write_errors = []
+            writer_thread = threading.Thread(
+                target=self._write_rows,
+                args=(batches, tmp_path, write_errors),
+                daemon=True
+            )
+            writer_thread.start()
 
-            # Write to CSV
-            if all_data:
-                fieldnames = [
-                    'type', 'title', 'show_title', 'season', 'episode', 'year',
-                    'rating', 'content_rating', 'duration_minutes', 'studio',
-                    'summary', 'genres', 'directors', 'actors', 'added_at',
-                    'last_viewed_at', 'view_count', 'file_path', 'file_size_gb',
-                    'video_resolution', 'imdb_id', 'imdb_url', 'plex_key'
-                ]
-
-                with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(all_data)
-
-                logger.info(f"Exported {len(all_data)} items to {csv_path}")
-
-                # Also create/update a "latest" symlink or copy
-                latest_path = self.output_dir / f"plex_library_{library_name.replace(' ', '_')}_latest.csv"
-                with open(latest_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(all_data)
-
-                logger.info(f"Updated latest file: {latest_path}")
-            else:
-                logger.warning(f"No items found in library: {library_name}")
-
-            return str(csv_path)
+            row_count = 0
+            try:
+                # Rows are pulled from the generator and handed over in batches
+                rows = self._iter_rows(library)
+                try:
+                    for batch in iter(lambda: list(islice(rows, WRITE_BATCH_SIZE)), []):
+                        # Stop scanning as soon as the writer has failed
+                        if write_errors:
+                            break
+                        batches.put(batch)
+                        row_count += len(batch)
+                finally:
+                    rows.close()
+                    batches.put(None)
+                    writer_thread.join()
+
+                if write_errors:
+                    raise write_errors[0]
+
+                if row_count:
+                    # Keep a compressed dated copy, then publish the plain CSV as latest
+                    archive_path = self._archive_csv(tmp_path, csv_path)
+                    logger.info(f"Exported {row_count} items to {archive_path}")
+
+                    os.replace(tmp_path, latest_path)
+                    logger.info(f"Updated latest file: {latest_path}")
+                else:
+                    archive_path = csv_path
+                    logger.warning(f"No items found in library: {library_name}")
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            return str(archive_path)
 
         except Exception as e:
             logger.error(f"Error monitoring library {library_name}: {e}")
@@ -228,12 +511,15 @@ class PlexMonitor:
 
         logger.info(f"Starting monitoring for {len(libraries)} libraries")
 
-        for library_name in libraries:
-            try:
-                self.monitor_library(library_name)
-            except Exception as e:
-                logger.error(f"Failed to monitor {library_name}: {e}")
-                continue
+        if libraries:
+            # Libraries are independent scans; run a few side by side
+            with ThreadPoolExecutor(max_workers=min(len(libraries), MAX_LIBRARY_WORKERS)) as executor:
+                futures = {executor.submit(self.monitor_library, name): name for name in libraries}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to monitor {futures[future]}: {e}")
 
         logger.info("Monitoring complete")
 